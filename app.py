@@ -5,10 +5,45 @@ em um sistema de transporte agrícola. Ele permite o registro de informações s
 como quantidade, origem, destino e necessidades de transporte (ventilação e proteção solar),
 bem como a comparação de veículos disponíveis para transporte.
 """
+import argparse
 import json
 import oracledb
-import pandas as pd
 import os
+import sys
+
+try:
+    import orjson
+except ImportError:  # orjson é opcional; sem ele é usado o módulo json da biblioteca padrão
+    orjson = None
+
+pd = None  # pandas é importado na primeira listagem feita com a opção --pretty
+_pretty = False
+
+# Quantidade de cadastros confirmados juntos em um único commit. Uma queda do programa
+# entre dois commits perde no máximo esse número de cadastros.
+LIMITE_COMMIT = 10
+TAMANHO_PAGINA = 20  # Quantidade de linhas exibidas por vez nas listagens
+
+# Cadastros aguardando gravação em lote, na ordem das colunas de cada tabela
+_pending_produtos = []
+_pending_veiculos = []
+_uncommitted = 0  # Cadastros feitos desde o último commit
+
+# Resultados das consultas, descartados sempre que novos cadastros são gravados
+_cache = {'produtos': None, 'veiculos': None, 'colunas_produtos': None, 'colunas_veiculos': None}
+
+_SIMS = frozenset({'sim', 's'})
+_NAOS = frozenset({'não', 'nao', 'n'})
+
+# Tipos das variáveis de ligação de cada INSERT, na ordem das colunas
+_TIPOS_PRODUTOS = (oracledb.DB_TYPE_VARCHAR, int, oracledb.DB_TYPE_VARCHAR, oracledb.DB_TYPE_VARCHAR, float, float, int, int)
+_TIPOS_VEICULOS = (int, float, int, int)
+
+def limpar_tela():
+    """
+    Limpa o terminal com sequências de escape ANSI, sem abrir um processo do shell.
+    """
+    sys.stdout.write('\x1b[2J\x1b[H')
 
 def valor_nulo(campo, nome_campo):
     """
@@ -37,11 +72,8 @@ def validar_positivo(numero, nome_campo):
     Returns:
         bool: Retorna True se o número for inválido (não positivo), caso contrário False.
     """
-    try:
-        if numero <= 0:
-            raise ValueError(f"O valor de {nome_campo} deve ser positivo.")
-    except ValueError as e:
-        print("Digite um número válido!")
+    if numero is None or not (numero > 0):
+        print(f"O valor de {nome_campo} deve ser positivo.")
         return True
     return False
 
@@ -56,19 +88,24 @@ def perguntar_sim_nao(pergunta):
         bool: Retorna True se a resposta for 'sim', caso contrário False.
     """
     while True:
-        resposta = input(pergunta).lower()
-        if resposta in ['sim', 'não', 'nao']:
-            return resposta == 'sim'
-        else:
-            print("Por favor, responda apenas com 'sim' ou 'não'.")
+        resposta = input(pergunta).casefold()
+        if resposta in _SIMS:
+            return True
+        if resposta in _NAOS:
+            return False
+        print("Por favor, responda apenas com 'sim' ou 'não'.")
 
 def dados_coletados_produtos():
     """
-    Coleta dados sobre os produtos para transporte agrícola e insere no banco de dados.
+    Coleta dados sobre os produtos para transporte agrícola e os adiciona aos cadastros pendentes.
+
+    O INSERT só é enviado ao banco por `gravar_pendentes`: na próxima consulta, ao atingir
+    `LIMITE_COMMIT` cadastros ou ao sair. Erros de gravação aparecem nesse momento.
 
     Returns:
         dict: Dicionário contendo os dados do produto coletado.
     """
+    global _uncommitted
     while True:
         try:
             produto = input('Informe o nome do produto: ')
@@ -99,31 +136,38 @@ def dados_coletados_produtos():
         'destino': destino,
         'temperatura_minima': temperatura_minima,
         'temperatura_maxima': temperatura_maxima,
-        'ventilacao': 'SIM' if ventilacao else 'NAO',  # Converte True/False para 'SIM' ou 'NAO'
-        'protecao_solar': 'SIM' if protecao_solar else 'NAO'  # Converte True/False para 'SIM' ou 'NAO'
+        'ventilacao': 1 if ventilacao else 0,  # Converte True/False para 1 ou 0
+        'protecao_solar': 1 if protecao_solar else 0  # Converte True/False para 1 ou 0
     }
 
-    try:
-        inst_cadastro.execute("""
-            INSERT INTO transporte_agricola_produtos (produto, quantidade, origem, destino, temperatura_minima, temperatura_maxima, ventilacao, protecao_solar)
-            VALUES (:produto, :quantidade, :origem, :destino, :temperatura_minima, :temperatura_maxima, :ventilacao, :protecao_solar)
-        """, dados_produtos)
-        conn.commit()
-        
-        print("\n##### Dados GRAVADOS no banco #####")
-    except oracledb.DatabaseError as e:
-        error, = e.args
-        print(f"Erro ao inserir dados: {error.message}")
+    _pending_produtos.append((
+        dados_produtos['produto'],
+        dados_produtos['quantidade'],
+        dados_produtos['origem'],
+        dados_produtos['destino'],
+        dados_produtos['temperatura_minima'],
+        dados_produtos['temperatura_maxima'],
+        dados_produtos['ventilacao'],
+        dados_produtos['protecao_solar'],
+    ))
+    _uncommitted += 1
+    if _uncommitted >= LIMITE_COMMIT:
+        gravar_pendentes(confirmar=True)
+    else:
+        print("\n##### Dados REGISTRADOS, aguardando gravação em lote #####")
 
     return dados_produtos
 
 def dados_coletados_transporte():
     """
-    Coleta dados sobre os veículos de transporte e insere no banco de dados.
+    Coleta dados sobre os veículos de transporte e os adiciona aos cadastros pendentes.
+
+    Assim como em `dados_coletados_produtos`, o INSERT só é enviado ao banco por `gravar_pendentes`.
 
     Returns:
         dict: Dicionário contendo os dados do transporte coletado.
     """
+    global _uncommitted
     while True:
         try:
             capacidade = int(input('Informe a capacidade do transporte: '))
@@ -139,50 +183,136 @@ def dados_coletados_transporte():
     dados_transporte = {
         'capacidade': capacidade,
         'temperatura': temperatura_transporte,
-        'ventilacao': 'SIM' if ventilacao else 'NAO',
-        'protecao_solar': 'SIM' if protecao_solar else 'NAO'
+        'ventilacao': 1 if ventilacao else 0,
+        'protecao_solar': 1 if protecao_solar else 0
     }
 
+    _pending_veiculos.append((
+        dados_transporte['capacidade'],
+        dados_transporte['temperatura'],
+        dados_transporte['ventilacao'],
+        dados_transporte['protecao_solar'],
+    ))
+    _uncommitted += 1
+    if _uncommitted >= LIMITE_COMMIT:
+        gravar_pendentes(confirmar=True)
+    else:
+        print("\n##### Dados REGISTRADOS, aguardando gravação em lote #####")
+
+    return dados_transporte
+
+def gravar_pendentes(confirmar=False):
+    """
+    Grava no banco de dados os produtos e veículos acumulados em memória.
+
+    Os cadastros pendentes são enviados com um único `executemany` por tabela,
+    evitando uma ida ao servidor para cada linha. Os tipos das colunas são declarados
+    antes de cada lote, pois o mesmo cursor executa os dois INSERTs, e assim o driver
+    não precisa inferi-los dos valores. As consultas feitas na mesma conexão já enxergam
+    as linhas inseridas, por isso o commit só é feito quando solicitado.
+
+    Args:
+        confirmar (bool): Se True, confirma com um commit todos os cadastros feitos desde o último.
+    """
+    global _uncommitted
+    if not _pending_produtos and not _pending_veiculos and not (confirmar and _uncommitted):
+        return
+
     try:
-        inst_cadastro.execute("""
-            INSERT INTO transporte_agricola_veiculos (capacidade, temperatura, ventilacao, protecao_solar)
-            VALUES (:capacidade, :temperatura, :ventilacao, :protecao_solar)
-        """, dados_transporte)
-        conn.commit()
-        
-        print("\n##### Dados GRAVADOS no banco #####")
+        if _pending_produtos:
+            inst_cadastro.setinputsizes(*_TIPOS_PRODUTOS)
+            inst_cadastro.executemany("""
+                INSERT INTO transporte_agricola_produtos (produto, quantidade, origem, destino, temperatura_minima, temperatura_maxima, ventilacao, protecao_solar)
+                VALUES (:1, :2, :3, :4, :5, :6, :7, :8)
+            """, _pending_produtos, batcherrors=True)
+            for error in inst_cadastro.getbatcherrors():
+                print(f"Erro ao inserir produto {_pending_produtos[error.offset][0]}: {error.message}")
+            _pending_produtos.clear()
+            _cache['produtos'] = None
+
+        if _pending_veiculos:
+            inst_cadastro.setinputsizes(*_TIPOS_VEICULOS)
+            inst_cadastro.executemany("""
+                INSERT INTO transporte_agricola_veiculos (capacidade, temperatura, ventilacao, protecao_solar)
+                VALUES (:1, :2, :3, :4)
+            """, _pending_veiculos, batcherrors=True)
+            for error in inst_cadastro.getbatcherrors():
+                print(f"Erro ao inserir veículo: {error.message}")
+            _pending_veiculos.clear()
+            _cache['veiculos'] = None
+
+        if confirmar:
+            conn.commit()
+            _uncommitted = 0
+            print("\n##### Dados GRAVADOS no banco #####")
     except oracledb.DatabaseError as e:
         error, = e.args
         print(f"Erro ao inserir dados: {error.message}")
 
-    return dados_transporte
+def exibir_tabela(colunas, linhas):
+    """
+    Exibe as linhas de uma consulta em formato de tabela, uma página por vez.
+
+    As larguras das colunas são calculadas sobre todas as linhas, mantendo as páginas alinhadas.
+
+    Args:
+        colunas (list): Nomes das colunas, na mesma ordem dos valores de cada linha.
+        linhas (iterable): Linhas (tuplas) a serem exibidas.
+    """
+    global pd
+    if _pretty:
+        if pd is None:
+            import pandas as pd
+        print(pd.DataFrame.from_records(list(linhas), columns=colunas, index=colunas[0]))
+        return
+
+    linhas = [[str(valor) for valor in linha] for linha in linhas]
+    larguras = [max(len(valor) for valor in coluna) for coluna in zip(colunas, *linhas)]
+    cabecalho = '  '.join(coluna.ljust(largura) for coluna, largura in zip(colunas, larguras))
+    for inicio in range(0, len(linhas), TAMANHO_PAGINA):
+        if inicio:
+            input("\nPressione ENTER para ver mais")
+        print(cabecalho)
+        for linha in linhas[inicio:inicio + TAMANHO_PAGINA]:
+            print('  '.join(valor.ljust(largura) for valor, largura in zip(linha, larguras)))
 
 def consultar_produtos():
     """
     Consulta os produtos cadastrados no banco de dados.
 
+    Antes da consulta grava no banco (sem commit) os cadastros pendentes, para que eles
+    apareçam no resultado; erros dessa gravação são exibidos aqui.
+
     Returns:
-        list: Lista de produtos cadastrados.
-    """
-    inst_consulta.execute('SELECT * FROM transporte_agricola_produtos')
-    data = inst_consulta.fetchall()
-    return data
+        dict: Produtos cadastrados (tuplas), indexados por `id_produto`.
+    """
+    gravar_pendentes()
+    if _cache['produtos'] is None:
+        # ventilacao e protecao_solar são gravadas como 1/0 e exibidas como 'SIM'/'NAO'
+        inst_consulta.execute("""
+            SELECT id_produto, produto, quantidade, origem, destino, temperatura_minima, temperatura_maxima,
+                   CASE ventilacao WHEN 1 THEN 'SIM' WHEN 0 THEN 'NAO' END AS ventilacao,
+                   CASE protecao_solar WHEN 1 THEN 'SIM' WHEN 0 THEN 'NAO' END AS protecao_solar
+            FROM transporte_agricola_produtos
+        """)
+        _cache['colunas_produtos'] = [coluna[0].lower() for coluna in inst_consulta.description]  # O Oracle devolve os nomes em maiúsculas
+        _cache['produtos'] = {produto[0]: produto for produto in inst_consulta.fetchall()}
+    return _cache['produtos']
 
 def listar_produtos():
     """
     Lista e exibe todos os produtos cadastrados no banco de dados.
 
     Returns:
-        list: Lista de produtos cadastrados.
+        dict: Produtos cadastrados (tuplas), indexados por `id_produto`.
     """
     print("----- LISTAR PRODUTOS -----\n")
     produtos = consultar_produtos() 
-    if produtos is None or not produtos:
+    if not produtos:
         print("Não há produtos cadastrados.")
         return None
 
-    produtos_df = pd.DataFrame.from_records(produtos, columns=['id_produto', 'produto', 'quantidade', 'origem', 'destino', 'temperatura_minima', 'temperatura_maxima', 'ventilacao', 'protecao_solar'], index='id_produto')
-    print(produtos_df)
+    exibir_tabela(_cache['colunas_produtos'], produtos.values())
     print("\n##### LISTADOS! #####")
     
     return produtos
@@ -191,84 +321,93 @@ def comparar_veiculo():
     """
     Compara a compatibilidade entre um veículo e o produto para transporte, verificando as condições de capacidade, temperatura, ventilação e proteção solar.
 
+    As condições são avaliadas pelo próprio banco de dados, na view `v_produto_veiculo_compat`
+    (ver tabelas.txt), que retorna apenas os veículos compatíveis com cada produto.
+
     Returns:
-        bool: Retorna True se um veículo compatível for encontrado, caso contrário False.
+        bool: Retorna True se um veículo compatível for encontrado, caso contrário False
+        (None se a consulta de compatibilidade falhar).
     """
-    veiculos = consultar_veiculos()
-    if veiculos is None:
-        os.system('cls')
-        print('Não há veículos para comparação.')
-        return 
-
-    veiculo_df = pd.DataFrame.from_records(veiculos, columns=['id_veiculo', 'capacidade', 'temperatura', 'ventilacao', 'protecao_solar'], index='id_veiculo')
-    
     produtos = listar_produtos()
     if produtos is None:
         print("Não há produtos cadastrados.")
         return
-    id_produto = input('Insira o ID do produto: ')
-    if produtos is not None:
-        produtos_df = pd.DataFrame.from_records(produtos, columns=['id_produto', 'produto', 'quantidade', 'origem', 'destino', 'temperatura_minima', 'temperatura_maxima', 'ventilacao', 'protecao_solar'], index='id_produto')
-
-        if id_produto.isdigit() and int(id_produto) in produtos_df.index:
-            produto_quantidade = produtos_df.loc[int(id_produto), 'quantidade']  
-            temperatura_minima = produtos_df.loc[int(id_produto), 'temperatura_minima']
-            temperatura_maxima = produtos_df.loc[int(id_produto), 'temperatura_maxima']
-            ventilacao_produto = produtos_df.loc[int(id_produto), 'ventilacao']
-            protecao_solar_produto = produtos_df.loc[int(id_produto), 'protecao_solar']
-
-            for idx, veiculo in veiculo_df.iterrows():
-                capacidade_ok = produto_quantidade <= veiculo['capacidade']
-                temperatura_ok = temperatura_minima <= veiculo['temperatura'] <= temperatura_maxima
-                ventilacao_ok = (ventilacao_produto == 'SIM' and veiculo['ventilacao'] == 'SIM') or (ventilacao_produto == 'NAO' and veiculo['ventilacao'] == 'NAO')
-                protecao_solar_ok = (protecao_solar_produto == 'SIM' and veiculo['protecao_solar'] == 'SIM') or (protecao_solar_produto == 'NAO' and veiculo['protecao_solar'] == 'NAO')
-
-                if capacidade_ok and temperatura_ok and ventilacao_ok and protecao_solar_ok:
-                    print(f"Veículo {idx} disponível com todas as condições atendidas:")
-                    print(f"  - Capacidade: {veiculo['capacidade']} (produto: {produto_quantidade})")
-                    print(f"  - Temperatura: {veiculo['temperatura']} (mínima: {temperatura_minima}, máxima: {temperatura_maxima})")
-                    print(f"  - Ventilação: {veiculo['ventilacao']}")
-                    print(f"  - Proteção Solar: {veiculo['protecao_solar']}")
-                    return True
-            
-            print(f"\n### Erro: Nenhum veículo disponível atende todas as condições para o produto {produtos_df.loc[int(id_produto), 'produto']}. ###")
-            print('\n')
-            listar_veiculos()
-            return False
-        else:
-            os.system('cls')
+    while True:
+        id_produto = input('Insira o ID do produto: ')
+        produto = produtos.get(int(id_produto)) if id_produto.isdigit() else None
+        if produto is None:
             print(f"Produto com ID {id_produto} não encontrado.")
-            return comparar_veiculo()
-    else:
-        print("Não há produtos cadastrados.")
+            continue
+        break
+
+    _, nome_produto, produto_quantidade, _, _, temperatura_minima, temperatura_maxima, _, _ = produto
+
+    try:
+        inst_consulta.execute("""
+            SELECT id_veiculo, capacidade, temperatura, ventilacao, protecao_solar
+            FROM v_produto_veiculo_compat
+            WHERE id_produto = :id
+            FETCH FIRST 1 ROWS ONLY
+        """, {'id': int(id_produto)})
+
+        veiculo = inst_consulta.fetchone()
+    except oracledb.DatabaseError as e:
+        error, = e.args
+        print(f"Erro ao verificar compatibilidade: {error.message}")
+        print("Verifique se a view v_produto_veiculo_compat foi criada (ver tabelas.txt).")
         return None
 
+    if veiculo is not None:
+        id_veiculo, capacidade, temperatura, ventilacao, protecao_solar = veiculo
+        print(f"Veículo {id_veiculo} disponível com todas as condições atendidas:")
+        print(f"  - Capacidade: {capacidade} (produto: {produto_quantidade})")
+        print(f"  - Temperatura: {temperatura} (mínima: {temperatura_minima}, máxima: {temperatura_maxima})")
+        print(f"  - Ventilação: {'SIM' if ventilacao else 'NAO'}")
+        print(f"  - Proteção Solar: {'SIM' if protecao_solar else 'NAO'}")
+        return True
+
+    print(f"\n### Erro: Nenhum veículo disponível atende todas as condições para o produto {nome_produto}. ###")
+    print('\n')
+    listar_veiculos()
+    return False
+
 def consultar_veiculos():
     """
     Consulta os veículos cadastrados no banco de dados.
 
+    Antes da consulta grava no banco (sem commit) os cadastros pendentes, para que eles
+    apareçam no resultado; erros dessa gravação são exibidos aqui.
+
     Returns:
-        list: Lista de veículos cadastrados.
-    """
-    inst_consulta.execute('SELECT * FROM transporte_agricola_veiculos')
-    data = inst_consulta.fetchall()
-    return data
+        dict: Veículos cadastrados (tuplas), indexados por `id_veiculo`.
+    """
+    gravar_pendentes()
+    if _cache['veiculos'] is None:
+        # ventilacao e protecao_solar são gravadas como 1/0 e exibidas como 'SIM'/'NAO'
+        inst_consulta.execute("""
+            SELECT id_veiculo, capacidade, temperatura,
+                   CASE ventilacao WHEN 1 THEN 'SIM' WHEN 0 THEN 'NAO' END AS ventilacao,
+                   CASE protecao_solar WHEN 1 THEN 'SIM' WHEN 0 THEN 'NAO' END AS protecao_solar
+            FROM transporte_agricola_veiculos
+        """)
+        _cache['colunas_veiculos'] = [coluna[0].lower() for coluna in inst_consulta.description]  # O Oracle devolve os nomes em maiúsculas
+        _cache['veiculos'] = {veiculo[0]: veiculo for veiculo in inst_consulta.fetchall()}
+    return _cache['veiculos']
 
 def listar_veiculos():
     """
     Lista e exibe todos os veículos cadastrados no banco de dados.
 
     Returns:
-        list: Lista de veículos cadastrados.
+        dict: Veículos cadastrados (tuplas), indexados por `id_veiculo`.
     """
     print("----- LISTAR VEICULOS -----\n")
     veiculos = consultar_veiculos()
-    if veiculos is None or not veiculos:
+    if not veiculos:
         print("Não há veiculos cadastrados.")
         return None
-    veiculos_df = pd.DataFrame.from_records(veiculos, columns=['id_veiculo', 'capacidade', 'temperatura', 'ventilacao', 'protecao_solar'], index='id_veiculo')
-    print(veiculos_df)
-    return veiculos_df
+    exibir_tabela(_cache['colunas_veiculos'], veiculos.values())
+    return veiculos
 
 def menu():
     """
@@ -294,66 +433,41 @@ def menu():
 
         """)
             escolha_menu = int(input(margem + 'Escolha: '))
-            if escolha_menu not in [1, 2, 3, 4, 5,6,7]:
-                os.system('cls')
+            if escolha_menu not in _ACOES:
+                limpar_tela()
                 raise ValueError("Escolha inválida. Tente novamente.")
             return escolha_menu
         except ValueError as e:
-            os.system('cls')
+            limpar_tela()
             print("Escolha inválida. Tente novamente.")
         
 def sair():
     """
     Finaliza a execução do programa.
 
-    Fecha a conexão com o banco de dados (se estiver aberta) e encerra a aplicação.
+    Grava e confirma os cadastros pendentes, fecha a conexão com o banco de dados (se estiver aberta)
+    e encerra a aplicação.
     """
-    os.system('cls')
     print("Saindo do programa...")
     # Fecha a conexão com o banco de dados se estiver aberta
     if conn is not None:
-        conn.close()  
+        gravar_pendentes(confirmar=True)
+        encerrar_conexao()
     exit(0)
 
-def opcao_escolhida(escolha):
+def opcao_escolhida():
     """
-    Executa a função correspondente à opção selecionada pelo usuário no menu.
+    Executa, em laço, a função correspondente à opção selecionada pelo usuário no menu.
 
-    Com base na escolha feita pelo usuário, a função correspondente é chamada para realizar a ação desejada.
-    
-    Args:
-        escolha (int): Número da opção escolhida pelo usuário no menu.
-
-    Raises:
-        ValueError: Se a escolha não for um número válido dentro do intervalo das opções.
+    A escolha feita pelo usuário é procurada em `_ACOES` e a função correspondente é chamada
+    para realizar a ação desejada, até que o usuário escolha sair.
     """
     while True:
-        match escolha:
-            case 1:
-                os.system('cls')
-                dados_coletados_produtos()
-            case 2:
-                os.system('cls')
-                dados_coletados_transporte()
-            case 3: 
-                os.system('cls')
-                listar_produtos()
-            case 4:
-                os.system('cls')
-                listar_veiculos()
-            case 5:
-                os.system('cls')
-                comparar_veiculo()
-            case 6:
-                opcao_seis()
-            case 7:
-                os.system('cls')
-                sair()
-                
-        
+        limpar_tela()
+        acao = _ACOES[menu()]
+        limpar_tela()
+        acao()
         input("Pressione ENTER")
-        os.system('cls')
-        escolha = menu()
 
 def opcao_seis():
     """
@@ -363,7 +477,6 @@ def opcao_seis():
     em formato JSON (produtos, veículos ou ambos).
     """
     try:
-        os.system('cls')
         opcao_seis = int(input("""
         Escolha:
         [1] - Salvar Produtos.
@@ -374,9 +487,27 @@ def opcao_seis():
         if opcao_seis == 2:
             salvar_veiculo_json()
     except ValueError as e:
-        os.system('cls')
+        limpar_tela()
         print("Escolha inválida. Tente novamente.")
 
+def gravar_json(arquivo, dados):
+    """
+    Grava um dicionário em um arquivo JSON, usando o orjson quando estiver instalado.
+
+    Os dois caminhos geram o mesmo arquivo: UTF-8, indentação de 2 espaços (a única que o
+    orjson oferece) e caracteres acentuados sem escape.
+
+    Args:
+        arquivo (str): Caminho do arquivo JSON a ser gravado.
+        dados (dict): Dados a serem gravados.
+    """
+    if orjson is not None:
+        conteudo = orjson.dumps(dados, option=orjson.OPT_INDENT_2)
+    else:
+        conteudo = json.dumps(dados, indent=2, ensure_ascii=False).encode('utf-8')
+    with open(arquivo, 'wb') as json_file:
+        json_file.write(conteudo)
+
 def salvar_dados_produtos_json():
     """
     Salva os dados dos produtos cadastrados no banco de dados em um arquivo JSON.
@@ -384,28 +515,20 @@ def salvar_dados_produtos_json():
     O arquivo JSON é gerado com as informações dos produtos cadastrados, incluindo 
     nome, quantidade, temperatura mínima e máxima recomendadas.
 
+    A listagem vem de `_cache` quando nenhum cadastro foi gravado desde a última consulta,
+    sem nova ida ao banco, e o produto escolhido é obtido diretamente pelo seu ID.
+
     Returns:
         str: Caminho do arquivo JSON gerado.
     """
     produtos = listar_produtos()
     if produtos:
         id_produto = input('Insira o ID do produto que deseja salvar em JSON: ')
-        if id_produto.isdigit() and int(id_produto) in [p[0] for p in produtos]:
-            produto_escolhido = [p for p in produtos if p[0] == int(id_produto)][0]
-            dados_produto = {
-                'id_produto': produto_escolhido[0],
-                'produto': produto_escolhido[1],
-                'quantidade': produto_escolhido[2],
-                'origem': produto_escolhido[3],
-                'destino': produto_escolhido[4],
-                'temperatura_minima': produto_escolhido[5],
-                'temperatura_maxima': produto_escolhido[6],
-                'ventilacao': produto_escolhido[7],
-                'protecao_solar': produto_escolhido[8],
-            }
+        produto_escolhido = produtos.get(int(id_produto)) if id_produto.isdigit() else None
+        if produto_escolhido is not None:
+            dados_produto = dict(zip(_cache['colunas_produtos'], produto_escolhido))
             arquivo = f"produto_{dados_produto['produto']}.json"
-            with open(arquivo, 'w') as json_file:
-                json.dump(dados_produto, json_file, indent=4)
+            gravar_json(arquivo, dados_produto)
             print(f"Dados do produto {dados_produto['produto']} salvos no arquivo {arquivo}.")
         else:
             print("ID do produto inválido.")
@@ -419,73 +542,141 @@ def salvar_veiculo_json():
     O arquivo JSON é gerado com as informações atuais dos veículos cadastrados,
     incluindo capacidade, temperatura mínima e máxima, ventilação e proteção solar.
 
+    Assim como em `salvar_dados_produtos_json`, a listagem vem de `_cache` enquanto nenhum
+    veículo novo for gravado.
+
     Returns:
         str: Caminho do arquivo JSON gerado.
     """
     veiculos = listar_veiculos()
 
-    if veiculos is not None and not veiculos.empty:
+    if veiculos:
         id_veiculo = input('Insira o ID do veículo que deseja salvar em JSON: ')
 
-        if id_veiculo.isdigit() and int(id_veiculo) in veiculos.index:
-            veiculo_escolhido = veiculos.loc[int(id_veiculo)]
-
-            dados_veiculo = {
-                'id_veiculo': int(id_veiculo),
-                'capacidade': veiculo_escolhido['capacidade'],
-                'temperatura': veiculo_escolhido['temperatura'],
-                'ventilacao': veiculo_escolhido['ventilacao'],
-                'protecao_solar': veiculo_escolhido['protecao_solar'],
-            }
+        veiculo_escolhido = veiculos.get(int(id_veiculo)) if id_veiculo.isdigit() else None
+        if veiculo_escolhido is not None:
+            dados_veiculo = dict(zip(_cache['colunas_veiculos'], veiculo_escolhido))
 
             arquivo = f"veiculo_{dados_veiculo['id_veiculo']}.json"
-            with open(arquivo, 'w') as json_file:
-                json.dump(dados_veiculo, json_file, indent=4)
+            gravar_json(arquivo, dados_veiculo)
             print(f"Dados do veículo {dados_veiculo['id_veiculo']} salvos no arquivo {arquivo}.")
         else:
             print("ID do veículo inválido.")
     else:
         print("Não há veículos para salvar em JSON.")
 
+# Função executada para cada opção do menu
+_ACOES = {
+    1: dados_coletados_produtos,
+    2: dados_coletados_transporte,
+    3: listar_produtos,
+    4: listar_veiculos,
+    5: comparar_veiculo,
+    6: opcao_seis,
+    7: sair,
+}
+
 import oracledb
 
+pool = None  # Pool de conexões, criado por conectar_banco_oracle()
+
 #Necessita informar dados de acesso ao banco:
 def conectar_banco_oracle():
     """
     Estabelece uma conexão com o banco de dados Oracle.
 
-    Usa as credenciais e parâmetros de conexão configurados para conectar ao banco de dados Oracle,
-    permitindo a execução de consultas e operações de manipulação de dados.
+    Usa as credenciais e parâmetros de conexão configurados para criar um pool de conexões
+    com o banco de dados Oracle e obtém uma conexão dele, permitindo a execução de consultas
+    e operações de manipulação de dados. O cache de instruções mantém as instruções SQL já
+    preparadas, evitando que sejam analisadas novamente a cada execução.
     
     Returns:
-        connection (cx_Oracle.Connection): Objeto de conexão estabelecido com o banco de dados Oracle.
+        connection (oracledb.Connection): Objeto de conexão obtido do pool de conexões.
 
     Raises:
-        cx_Oracle.DatabaseError: Se ocorrer algum erro ao tentar estabelecer a conexão.
+        oracledb.DatabaseError: Se ocorrer algum erro ao tentar estabelecer a conexão.
     """
+    global pool
     try:
-        conn = oracledb.connect(user='rmxxxx', password='DDMMAA', dsn='oracle.fiap.com.br:1521/ORCL') #Informar credencias
+        # Sem oracledb.init_oracle_client() o driver permanece no modo thin, sem carregar o Oracle Instant Client
+        # A aplicação tem uma única thread e usa uma única conexão, por isso o pool não cresce além dela
+        pool = oracledb.create_pool(user='rmxxxx', password='DDMMAA', dsn='oracle.fiap.com.br:1521/ORCL', min=1, max=1, increment=0, stmtcachesize=40) #Informar credencias
+        conn = pool.acquire()
         return conn 
     except oracledb.DatabaseError as e:
         print("Erro ao conectar ao banco de dados:", e)
+        if pool is not None:
+            pool.close(force=True)
+            pool = None
         return None 
 
+def encerrar_conexao():
+    """
+    Fecha os cursores, a conexão e o pool de conexões com o banco de dados, se estiverem abertos.
+    """
+    global conn, pool
+    if conn is None:
+        return
+    inst_cadastro.close()
+    inst_consulta.close()
+    conn.close()
+    conn = None
+    pool.close()
+    pool = None
+
+def esquema_migrado():
+    """
+    Verifica se as colunas ventilacao/protecao_solar já foram convertidas para NUMBER(1).
+
+    Em tabelas ainda não migradas as consultas falhariam ao converter 'SIM'/'NAO' e os novos
+    cadastros gravariam '1'/'0' ao lado dos valores antigos, por isso a aplicação não é iniciada.
+
+    Returns:
+        bool: Retorna True se as colunas estiverem migradas, caso contrário False.
+    """
+    inst_consulta.execute("""
+        SELECT COUNT(*)
+        FROM user_tab_columns
+        WHERE table_name IN ('TRANSPORTE_AGRICOLA_PRODUTOS', 'TRANSPORTE_AGRICOLA_VEICULOS')
+          AND column_name IN ('VENTILACAO', 'PROTECAO_SOLAR')
+          AND data_type <> 'NUMBER'
+    """)
+    colunas_antigas, = inst_consulta.fetchone()
+    if colunas_antigas:
+        print("As colunas ventilacao/protecao_solar ainda estão no formato 'SIM'/'NAO'.")
+        print("Execute o script migracao_sim_nao.txt no banco de dados antes de usar a aplicação.")
+        return False
+    return True
+
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Rastreamento de produtos agrícolas.')
+    parser.add_argument('--pretty', action='store_true', help='Exibe as tabelas com o pandas.')
+    args = parser.parse_args()
+    _pretty = args.pretty
+    if os.name == 'nt':
+        os.system('')  # Habilita o processamento de sequências ANSI no console do Windows
+
     conn = conectar_banco_oracle()
 
     if conn:
         inst_cadastro = conn.cursor()
+        inst_cadastro.arraysize = 1000
+        # Busca até 1000 linhas por ida ao servidor. Cada cursor mantém em memória
+        # aproximadamente arraysize x largura da linha bytes.
         inst_consulta = conn.cursor()
-        inst_alteracao = conn.cursor()
-        inst_exclusao = conn.cursor()
-        escolha = menu()
-        opcao_escolhida(escolha)
-        dados_produtos = dados_coletados_produtos()
-        inst_cadastro.close()
-        inst_consulta.close()
-        inst_alteracao.close()
-        inst_exclusao.close()
-        conn.close()
+        inst_consulta.arraysize = 1000
+        inst_consulta.prefetchrows = 1001
+        # Ctrl-C, fim da entrada ou um erro inesperado também gravam e confirmam os
+        # cadastros pendentes; apenas uma queda do processo perde até LIMITE_COMMIT cadastros.
+        try:
+            if esquema_migrado():
+                opcao_escolhida()
+        except (KeyboardInterrupt, EOFError):
+            print("\nSaindo do programa...")
+        finally:
+            if conn is not None:  # sair() já encerra a conexão
+                gravar_pendentes(confirmar=True)
+                encerrar_conexao()
     else:
         print('Não foi possível estabelecer conexão com o banco de dados, tente novamente.')